@@ -0,0 +1,10 @@
+"""
+Flight planning for aerial photography with a pin-hole camera model.
+"""
+
+from .batch import PlanBatch
+from .camera import Camera
+from .io import NumpyEncoder
+from .planner import FlightPlanner, photo_ground_area
+
+__all__ = ['Camera', 'FlightPlanner', 'NumpyEncoder', 'PlanBatch', 'photo_ground_area']
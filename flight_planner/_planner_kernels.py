@@ -0,0 +1,56 @@
+"""
+Numba compiled kernels for sweeping flight parameters over many heights.
+
+Importing this module raises ImportError when numba is not installed, in
+which case flight_planner falls back to its NumPy implementation.
+"""
+
+from numba import njit, prange
+
+
+@njit(cache=True)
+def compute_kernel(h,f,sensor_x,sensor_y,gsd_per_scale,fo_factor,so_factor):
+    """
+    Computes the flight parameters of a single height.
+
+    Parameters:
+        h:              flying height above ground level (m)
+        f:              focal length (m)
+        sensor_x:       sensor size along x (m)
+        sensor_y:       sensor size along y (m)
+        gsd_per_scale:  gsd (cm) per unit of photo scale
+        fo_factor:      1 - forward overlap between images as a fraction
+        so_factor:      1 - side overlap between images as a fraction
+
+    Returns:
+        (photo_scale, swath_x, swath_y, base_length, strip_offset,
+         ground_area, gsd)
+    """
+    m = h/f
+    swath_x = m*sensor_x
+    swath_y = m*sensor_y
+    base = swath_y * fo_factor
+    strip = swath_x * so_factor
+    area = swath_x * swath_y
+    gsd = m*gsd_per_scale
+    return m, swath_x, swath_y, base, strip, area, gsd
+
+
+@njit(cache=True, parallel=True)
+def compute_many(heights,f,sensor,gsd_per_scale,fo_factor,so_factor,
+                 photo_scale,swath,base_length,strip_offset,ground_area,gsd):
+    """
+    Computes the flight parameters of every height in parallel, writing
+    them into the given output arrays: swath of shape (n,2) and the others
+    of shape (n,).
+    """
+    for i in prange(heights.shape[0]):
+        m, sx, sy, base, strip, area, g = compute_kernel(
+            heights[i], f, sensor[0], sensor[1], gsd_per_scale, fo_factor, so_factor)
+        photo_scale[i] = m
+        swath[i,0] = sx
+        swath[i,1] = sy
+        base_length[i] = base
+        strip_offset[i] = strip
+        ground_area[i] = area
+        gsd[i] = g
@@ -0,0 +1,56 @@
+import numpy as np
+from dataclasses import dataclass
+
+
+@dataclass(slots=True, eq=False)
+class PlanBatch:
+    """
+    Flight parameters of a sweep over flying heights, stored as one
+    contiguous array per parameter.
+
+    Parameters:
+        height:             flying heights above ground level (m), shape (n,)
+        gsd:                ground sampling distances (cm), shape (n,)
+        swath:              ground coverage of a photo (m), shape (n,2)
+        photo_scale:        photo scale numbers, shape (n,)
+        base_length:        base distances between successive shots (m), shape (n,)
+        strip_offset:       offsets between adjacent strips (m), shape (n,)
+        ground_area:        ground areas covered by a photo (m^2), shape (n,)
+        forward_overlap:    forward overlap between images in %
+        side_overlap:       side overlap between images in %
+    """
+    height: np.ndarray
+    gsd: np.ndarray
+    swath: np.ndarray
+    photo_scale: np.ndarray
+    base_length: np.ndarray
+    strip_offset: np.ndarray
+    ground_area: np.ndarray
+    forward_overlap: float
+    side_overlap: float
+
+    def __len__(self):
+        return len(self.height)
+
+    def to_frame(self):
+        """
+        Converts the sweep to a pandas DataFrame with one row per height.
+
+        Returns:
+            frame (pandas.DataFrame):   Flight parameters, the swath split
+                                        into swath_x and swath_y columns
+        """
+        import pandas as pd
+
+        return pd.DataFrame({
+            'height': self.height,
+            'gsd': self.gsd,
+            'forward_overlap': self.forward_overlap,
+            'side_overlap': self.side_overlap,
+            'swath_x': self.swath[:,0],
+            'swath_y': self.swath[:,1],
+            'photo_scale': self.photo_scale,
+            'base_length': self.base_length,
+            'strip_offset': self.strip_offset,
+            'ground_area': self.ground_area,
+        })
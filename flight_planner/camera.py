@@ -0,0 +1,80 @@
+import numpy as np
+from dataclasses import dataclass
+
+
+@dataclass(slots=True, eq=False)
+class Camera:
+    """
+    Minimal pin-hole camera model.
+
+    Parameters:
+        f:              focal length/principal distance (mm)
+        pixel_size:     size of each pixel in metric unit
+        image_size:     image size in number of pixels (x,y)
+        sensor_size:    sensor size in metric unit (x,y), derived from
+                        pixel_size and image_size when not given
+        fov:            field of view (hfov, vfov)
+        dfov:           diagonal field of view
+        name:           camera name, used to name output files
+        max_fps:        maximum frame rate (1/s)
+        exposure:       exposure time (s)
+    """
+    f: float | None = None
+    pixel_size: float | None = None
+    image_size: tuple | None = None
+    sensor_size: tuple | None = None
+    fov: tuple | None = None
+    dfov: float | None = None
+    name: str | None = None
+    max_fps: float | None = None
+    exposure: float | None = None
+
+    def __post_init__(self):
+        if self.sensor_size is None and self.pixel_size is not None:
+            self.sensor_size = (self.pixel_size*self.image_size[0], self.pixel_size*self.image_size[1])
+        elif self.sensor_size is not None:
+            self.sensor_size = (float(self.sensor_size[0]), float(self.sensor_size[1]))
+
+    @property
+    def focal_length_m(self):
+        """
+        Focal length in metres.
+        """
+        return self.f/1000.0
+
+    @property
+    def gsd_per_scale(self):
+        """
+        Ground sampling distance (cm) per unit of photo scale.
+        """
+        return self.sensor_size[0]*100.0/self.image_size[0]
+
+    @property
+    def sensor_size_array(self):
+        """
+        Sensor size as a float64 array for vectorized computations.
+        """
+        return np.asarray(self.sensor_size,dtype=np.float64)
+
+    @property
+    def focal_length(self):
+        return self.f
+
+    @focal_length.setter
+    def focal_length(self,f):
+        self.f = f
+
+    def set_exposure(self,exposure):
+        """
+        Sets the exposure time, checking it against the maximum frame rate.
+
+        Parameters:
+            exposure:   exposure time (s)
+        """
+        fps = self.max_fps
+        if fps is None:
+            self.max_fps = 1/exposure
+        elif exposure >= 1/fps:
+            print("Exposure exceeds maximum fps")
+
+        self.exposure = exposure
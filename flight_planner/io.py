@@ -0,0 +1,160 @@
+import atexit
+import json
+import queue
+import threading
+import numpy as np
+from dataclasses import fields
+from functools import singledispatch
+
+try:
+    import orjson
+except ImportError:
+    # orjson is optional, plans are written with json and NumpyEncoder
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    # ujson is optional, compact output falls back to json
+    ujson = None
+
+
+@singledispatch
+def _jsonify(obj):
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+@_jsonify.register(np.ndarray)
+def _(obj):
+    return obj.tolist()
+
+@_jsonify.register(np.floating)
+def _(obj):
+    return float(obj)
+
+@_jsonify.register(np.integer)
+def _(obj):
+    return int(obj)
+
+
+class NumpyEncoder(json.JSONEncoder):
+    # converts NumPy arrays and scalars, dispatching on their type
+    default = staticmethod(_jsonify)
+
+
+def as_dict(obj):
+    """
+    Returns the public dataclass fields of obj that are set, as a dictionary.
+    """
+    return {f.name: getattr(obj,f.name) for f in fields(obj)
+            if not f.name.startswith('_') and getattr(obj,f.name) is not None}
+
+
+def to_builtin(data):
+    """
+    Converts the NumPy arrays and scalars in nested lists and dictionaries
+    to Python lists and numbers.
+    """
+    if isinstance(data,dict):
+        return {key: to_builtin(value) for key, value in data.items()}
+    if isinstance(data,(list,tuple)):
+        return [to_builtin(value) for value in data]
+    if isinstance(data,(np.ndarray,np.generic)):
+        return data.tolist()
+    return data
+
+
+def dumps(data,pretty=True):
+    """
+    Serializes data to JSON.
+
+    Parameters:
+        data:       JSON serializable data, may contain NumPy arrays
+        pretty:     indent the output by two spaces, compact output is faster
+                    to write
+
+    Returns:
+        JSON document (bytes)
+
+    NumPy values are converted to Python numbers first, so every backend
+    writes the same values, float32 ones included. The bytes still differ
+    in float notation, e.g. orjson writes 3.75e-6 where json writes 3.75e-06.
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        return orjson.dumps(to_builtin(data), option=option)
+    elif ujson is not None and not pretty:
+        return ujson.dumps(to_builtin(data)).encode()
+    else:
+        if pretty:
+            return json.dumps(data,indent=2,cls=NumpyEncoder).encode()
+        return json.dumps(data,separators=(",",":"),cls=NumpyEncoder).encode()
+
+
+class _AsyncJsonWriter:
+    """
+    Writes files on a background thread, so that the caller can compute the
+    next plan while the previous one is written.
+    """
+    def __init__(self):
+        self.q = queue.Queue()
+        self.error = None
+        self.t = threading.Thread(target=self._run, daemon=True)
+        self.t.start()
+
+    def _run(self):
+        while True:
+            path, buf = self.q.get()
+            try:
+                with open(path,"wb") as jsonfile:
+                    jsonfile.write(buf)
+            except Exception as e:
+                # keep the first error for flush() to raise in the caller
+                if self.error is None:
+                    self.error = e
+            finally:
+                self.q.task_done()
+
+    def flush(self):
+        self.q.join()
+        error, self.error = self.error, None
+        if error is not None:
+            raise error
+
+
+_WRITER = None
+_WRITER_LOCK = threading.Lock()
+
+
+def write_json(path,data,pretty=True):
+    """
+    Writes data to path in JSON format.
+
+    The data is serialized right away and written on a background thread,
+    call flush() to wait until the file is on disk.
+
+    Parameters:
+        path:       output file name
+        data:       JSON serializable data, may contain NumPy arrays
+        pretty:     indent the output, compact output is faster to write
+    """
+    global _WRITER
+    if _WRITER is None:
+        with _WRITER_LOCK:
+            # another thread may have started the writer while we waited
+            if _WRITER is None:
+                _WRITER = _AsyncJsonWriter()
+    _WRITER.q.put((path, dumps(data,pretty)))
+
+
+def flush():
+    """
+    Waits until all files queued by write_json are written.
+
+    Raises the first error that occurred while writing.
+    """
+    if _WRITER is not None:
+        _WRITER.flush()
+
+
+# don't lose queued files when the interpreter exits
+atexit.register(flush)
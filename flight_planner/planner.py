@@ -0,0 +1,376 @@
+import numpy as np
+from dataclasses import dataclass, field
+
+from .batch import PlanBatch
+from .camera import Camera
+from .io import as_dict, flush, write_json
+
+_compute_many = None
+_kernel_loaded = False
+
+
+def _kernel():
+    """
+    Imports the numba kernel on first use, returns None when numba is not
+    installed and compute_batch falls back to NumPy broadcasting.
+    """
+    global _compute_many, _kernel_loaded
+    if not _kernel_loaded:
+        try:
+            from ._planner_kernels import compute_many
+        except ImportError:
+            compute_many = None
+        _compute_many = compute_many
+        _kernel_loaded = True
+    return _compute_many
+
+
+@dataclass(slots=True, eq=False)
+class FlightPlanner:
+    """
+    Flight planner for a camera flown at a constant height.
+
+    Either height or gsd is given, the other one is derived by compute().
+    Height takes precedence when both are given and the default is the
+    maximum height for A2 class flying (120 m). After a compute(), assigning
+    a new height or gsd makes it drive the next plan, assigning both raises
+    ValueError.
+    The camera intrinsics are read once, when the planner is created.
+
+    Parameters:
+        camera:             Camera object
+        height:             flying height above ground level (m)
+        gsd:                ground sampling distance (cm)
+        forward_overlap:    forward overlap between images in %
+        side_overlap:       side overlap between images in %
+    """
+    camera: Camera
+    height: float | None = None
+    gsd: float | None = None
+    forward_overlap: float = 60
+    side_overlap: float = 40
+    swath: np.ndarray | None = field(default=None, init=False)
+    photo_scale: float | None = field(default=None, init=False)
+    base_length: float | None = field(default=None, init=False)
+    strip_offset: float | None = field(default=None, init=False)
+    ground_area: float | None = field(default=None, init=False)
+    _f: float | None = field(default=None, init=False, repr=False)
+    _gsd_per_scale: float | None = field(default=None, init=False, repr=False)
+    _sensor: np.ndarray | None = field(default=None, init=False, repr=False)
+    _img: np.ndarray | None = field(default=None, init=False, repr=False)
+    _scaled: tuple | None = field(default=None, init=False, repr=False)
+
+    def __post_init__(self):
+        # camera intrinsics in metric units, read once instead of per call
+        self._f = self.camera.focal_length_m
+        self._gsd_per_scale = self.camera.gsd_per_scale
+        self._sensor = self.camera.sensor_size_array
+        self._img = np.asarray(self.camera.image_size,dtype=np.float64)
+
+    def calculate_photo_area(self):
+        self._finalize()
+
+    def calculate_base(self):
+        """
+        Computes base distance between successive shots (m)
+        """
+        self._finalize()
+
+    def calculate_strip_offset(self):
+        """
+        Computes offset between adjacent strips (m)
+        """
+        self._finalize()
+
+    def _finalize(self):
+        """
+        Computes base length, strip offset and ground area from a single
+        read of the swath. calculate_photo_area, calculate_base and
+        calculate_strip_offset are kept as aliases of it.
+        """
+        s = self.swath
+        sx = s[0]
+        sy = s[1]
+        self.strip_offset = sx * (1.0 - self.side_overlap*0.01)
+        self.base_length = sy * (1.0 - self.forward_overlap*0.01)
+        self.ground_area = sx * sy
+
+    def scale_from_height(self,h):
+        m = h/self._f
+        self.photo_scale = m
+        self.swath = m*self._sensor
+
+    def scale_from_gsd(self,gsd):
+        S = (gsd/100)*self._img
+        self.photo_scale = gsd/self._gsd_per_scale
+        self.swath = S
+
+    def calculate_gsd(self):
+        self.gsd = self.photo_scale*self._gsd_per_scale
+
+    def calculate_height(self,gsd):
+        self.height = self.photo_scale*self._f
+
+    def calculate_blur(self,speed):
+        """
+        @TODO 
+        Calculates pixel blur based on platform speed.
+
+        Parameters:
+            speed:  platform speed (m/s)
+        """
+        pass
+
+    def _from_height(self):
+        # h is given, estimate gsd
+        self.scale_from_height(self.height)
+        self.calculate_gsd()
+
+    def _from_gsd(self):
+        # gsd is given, estimate h
+        self.scale_from_gsd(self.gsd)
+        self.calculate_height(self.gsd)
+
+    def _default(self):
+        # use default values, maximum height for A2 class flying
+        self.height = 120
+        self._from_height()
+
+    def compute(self):
+        """
+        Computes all flight parameters. 
+        """
+        self._scale()
+        self._finalize()
+
+    def update(self,**params):
+        """
+        Updates flight constraints and recomputes the flight parameters.
+
+        Setting height discards the derived gsd and vice versa, so the
+        given value drives the new plan. The photo scale and swath are only
+        recomputed when height or gsd changed since they were computed.
+
+        Parameters:
+            params:     any of height, gsd, forward_overlap, side_overlap
+        """
+        for key in params:
+            if key not in _CONSTRAINTS:
+                raise TypeError(f"'{key}' is not a flight constraint")
+        if 'height' in params:
+            self.gsd = None
+        elif 'gsd' in params:
+            self.height = None
+        for key, value in params.items():
+            setattr(self, key, value)
+        if (self.height, self.gsd) != self._scaled:
+            self._scale()
+        self._finalize()
+
+    def _scale(self):
+        """
+        Computes photo scale and swath from whichever of height and gsd is
+        given, or was assigned since the last computation.
+        """
+        if self._scaled is not None and self.height is not None and self.gsd is not None:
+            # both are set after a computation, keep the one that was assigned
+            height_changed = self.height != self._scaled[0]
+            gsd_changed = self.gsd != self._scaled[1]
+            if height_changed and gsd_changed:
+                raise ValueError("height and gsd were both changed, set only one of them")
+            if gsd_changed:
+                self.height = None
+        _DISPATCH[(self.height is not None, self.gsd is not None)](self)
+        self._scaled = (self.height, self.gsd)
+
+    def compute_batch(self,heights,out=None,dtype=np.float64,use_numba=False):
+        """
+        Computes flight parameters for several flying heights at once.
+
+        Parameters:
+            heights:    flying heights above ground level (m)
+            out:        plans returned by an earlier call for the same number
+                        of heights and dtype, their arrays are overwritten
+                        and reused, raises ValueError when they do not match
+            dtype:      floating point type of the computation and results
+            use_numba:  run the compiled numba kernel instead of NumPy, only
+                        pays off for repeated sweeps over millions of heights
+                        as the first call imports numba and loads the kernel
+
+        Returns:
+            plans (dictionary):  Flight parameters, one array entry per height,
+                                 and the overlaps they were computed with
+        """
+        dtype = np.dtype(dtype)
+        heights = np.asarray(heights,dtype=dtype)
+        n = len(heights)
+        if out is None:
+            out = {
+                'height': heights,
+                'gsd': np.empty(n,dtype),
+                'swath': np.empty((n,2),dtype),
+                'photo_scale': np.empty(n,dtype),
+                'base_length': np.empty(n,dtype),
+                'strip_offset': np.empty(n,dtype),
+                'ground_area': np.empty(n,dtype),
+            }
+        else:
+            for key in ('gsd','swath','photo_scale','base_length','strip_offset','ground_area'):
+                if out[key].dtype != dtype or len(out[key]) != n:
+                    raise ValueError(f"out['{key}'] holds {len(out[key])} {out[key].dtype} values, "
+                                     f"expected {n} {dtype} values")
+            out['height'] = heights
+        out['forward_overlap'] = self.forward_overlap
+        out['side_overlap'] = self.side_overlap
+        photo_scale = out['photo_scale']
+        swath = out['swath']
+
+        # intrinsics and overlaps in the working precision
+        scalar = dtype.type
+        f = scalar(self._f)
+        sensor = self._sensor.astype(dtype,copy=False)
+        gsd_per_scale = scalar(self._gsd_per_scale)
+        fo_factor = scalar(1.0 - self.forward_overlap*0.01)
+        so_factor = scalar(1.0 - self.side_overlap*0.01)
+
+        compute_many = _kernel() if use_numba else None
+        if compute_many is not None:
+            compute_many(heights, f, sensor, gsd_per_scale,
+                         fo_factor, so_factor, photo_scale, swath,
+                         out['base_length'], out['strip_offset'], out['ground_area'], out['gsd'])
+        else:
+            np.divide(heights, f, out=photo_scale)
+            np.multiply(photo_scale[:,None], sensor[None,:], out=swath)
+            np.multiply(photo_scale, gsd_per_scale, out=out['gsd'])
+            np.multiply(swath[:,1], fo_factor, out=out['base_length'])
+            np.multiply(swath[:,0], so_factor, out=out['strip_offset'])
+            np.multiply(swath[:,0], swath[:,1], out=out['ground_area'])
+        return out
+
+    def sweep(self,heights,dtype=np.float32,use_numba=False):
+        """
+        Computes flight parameters for several flying heights at once.
+
+        Single precision keeps about 7 significant digits, plenty for
+        swaths in metres and gsd in centimetres, at half the memory traffic.
+
+        Parameters:
+            heights:    flying heights above ground level (m)
+            dtype:      floating point type of the computation and results
+            use_numba:  run the compiled numba kernel, see compute_batch
+
+        Returns:
+            plans (PlanBatch):   Flight parameters, one array entry per height
+        """
+        return PlanBatch(**self.compute_batch(heights,dtype=dtype,use_numba=use_numba))
+
+    def write(self,format="yaml",pretty=True,suffix=""):
+        """
+        Writes flight parameters in JSON format to <camera name>_<height><suffix>.json
+
+        Parameters:
+            format:     Serializtion format
+            pretty:     indent the output
+            suffix:     appended to the file name, e.g. "_fo85_so85" to tell
+                        plans with different overlaps apart
+
+        """
+        plan = as_dict(self)
+        del plan['camera']
+        self._dump(plan,pretty,suffix)
+
+    def write_batch(self,plans,pretty=True,suffix=""):
+        """
+        Writes flight parameters computed by sweep or compute_batch in JSON
+        format, one file per height.
+
+        Parameters:
+            plans:      Flight parameters returned by sweep or compute_batch
+            pretty:     indent the output, pass False for large sweeps
+            suffix:     appended to each file name, see write()
+        """
+        if isinstance(plans,PlanBatch):
+            plans = as_dict(plans)
+        for plan in self._rows(plans):
+            self._dump(plan,pretty,suffix)
+
+    def flush(self):
+        """
+        Waits until all written flight parameters are on disk.
+        """
+        flush()
+
+    def _rows(self,plans):
+        """
+        Yields the flight parameters of each height in plans as a dictionary.
+        """
+        # look up each column once rather than once per row
+        height = _widen(plans['height'])
+        gsd = _widen(plans['gsd'])
+        swath = _widen(plans['swath'])
+        photo_scale = _widen(plans['photo_scale'])
+        base_length = _widen(plans['base_length'])
+        strip_offset = _widen(plans['strip_offset'])
+        ground_area = _widen(plans['ground_area'])
+        fo = plans['forward_overlap']
+        so = plans['side_overlap']
+        for i in range(len(height)):
+            yield {
+                'height': height[i].tolist(),
+                'gsd': gsd[i].tolist(),
+                'forward_overlap': fo,
+                'side_overlap': so,
+                'swath': swath[i].tolist(),
+                'photo_scale': photo_scale[i].tolist(),
+                'base_length': base_length[i].tolist(),
+                'strip_offset': strip_offset[i].tolist(),
+                'ground_area': ground_area[i].tolist(),
+            }
+
+    def _dump(self,plan,pretty,suffix):
+        data = [as_dict(self.camera),plan]
+        height = plan["height"]
+        if isinstance(height,float) and height.is_integer():
+            # whole heights from a sweep are named without a trailing .0
+            height = int(height)
+        write_json(self.camera.name + "_" + str(height) + suffix + ".json", data, pretty)
+
+
+def _widen(values):
+    """
+    Converts a column to float64 for writing. Single precision values are
+    widened through their shortest repr, so 8.52701 is written as such
+    rather than as 8.527009963989258.
+    """
+    values = np.asarray(values)
+    if values.dtype == np.float32:
+        return values.astype(str).astype(np.float64)
+    return values
+
+
+# Flight constraints accepted by FlightPlanner.update
+_CONSTRAINTS = ('height', 'gsd', 'forward_overlap', 'side_overlap')
+
+# Scale computation keyed by (height is given, gsd is given)
+_DISPATCH = {
+    (True,False): FlightPlanner._from_height,
+    (True,True): FlightPlanner._from_height,
+    (False,True): FlightPlanner._from_gsd,
+    (False,False): FlightPlanner._default,
+}
+
+
+def photo_ground_area(s,h,c):
+    """
+    Computes the ground area covered by a single photo (m^2).
+
+    Parameters:
+        s:      image side length on the sensor (m), or (sx,sy) for a
+                rectangular sensor
+        h:      flying height above ground level (m), scalar or array
+        c:      principal distance (m)
+    """
+    m_b = h/c
+    if np.isscalar(s):
+        return (s*s) * (m_b*m_b)
+    return s[0]*s[1] * (m_b*m_b)
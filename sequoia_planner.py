@@ -1,3 +1,4 @@
+import numpy as np
 import flight_planner as fp
 
 '''
@@ -7,16 +8,18 @@ Example for calculating flight parameters for different flying heights
 # Height above ground level
 height_agl = (60,90,120)
 
-for h in height_agl:
+# Create a camera model object for Sequoia based on camera specifications
+sequoia = fp.Camera(f = 3.98, pixel_size =3.75e-6, image_size=(1280,960),name="sequoia")
 
-    # Create a camera model object for Sequoia based on camera specifications
-    sequoia = fp.Camera(f = 3.98, pixel_size =3.75e-6, image_size=(1280,960),name="sequoia")
+# Create a flight planner object with the camera object and some flight constraints
+sequoia_plan = fp.FlightPlanner(sequoia, side_overlap=85, forward_overlap=85)
 
-    # Create a flight planner object with the camera object and some flight constraints
-    sequoia_plan = fp.FlightPlanner(sequoia,height =h, side_overlap=85, forward_overlap=85)
+# Compute all flight parameters for every height in one go, in double
+# precision to write the files with full digits
+plans = sequoia_plan.sweep(height_agl, dtype=np.float64)
 
-    # Compute all flight parameters
-    sequoia_plan.compute()
+# Write all camera and flight parameters to one JSON file per height
+sequoia_plan.write_batch(plans)
 
-    # Write all camera and flight parameters to JSON file
-    sequoia_plan.write()
\ No newline at end of file
+# Wait for the files, they are written in the background
+sequoia_plan.flush()
@@ -0,0 +1,37 @@
+import json
+
+import numpy as np
+import pytest
+
+from flight_planner import Camera, FlightPlanner, io
+from flight_planner.io import as_dict, dumps
+
+BACKENDS = ['json'] + [name for name in ('orjson','ujson') if getattr(io,name) is not None]
+
+
+def plan_data():
+    camera = Camera(f = 3.98, pixel_size =3.75e-6, image_size=(1280,960),name="sequoia")
+    planner = FlightPlanner(camera, side_overlap=85, forward_overlap=85)
+    plans = planner.sweep([60,90])
+    return [as_dict(camera), as_dict(plans), {'gsd': plans.gsd[0]}]
+
+
+def dumps_with(backend, monkeypatch, data, pretty):
+    # hide the backends picked before the one under test
+    if backend != 'orjson':
+        monkeypatch.setattr(io, 'orjson', None)
+    if backend == 'json':
+        monkeypatch.setattr(io, 'ujson', None)
+    return dumps(data, pretty)
+
+
+@pytest.mark.parametrize('pretty', [True, False])
+@pytest.mark.parametrize('backend', BACKENDS)
+def test_backends_write_the_same_values(backend, pretty, monkeypatch):
+    data = plan_data()
+    expected = json.loads(json.dumps(data, cls=io.NumpyEncoder))
+    with monkeypatch.context() as m:
+        written = dumps_with(backend, m, data, pretty)
+    assert json.loads(written) == expected
+    # one line per value when pretty, a single line otherwise
+    assert (b'\n  ' in written) == pretty
@@ -0,0 +1,48 @@
+import json
+
+import numpy as np
+import pytest
+
+from flight_planner import Camera, FlightPlanner
+
+COLUMNS = ('height','gsd','swath','photo_scale','base_length','strip_offset','ground_area')
+
+
+def sequoia_planner():
+    camera = Camera(f = 3.98, pixel_size =3.75e-6, image_size=(1280,960),name="sequoia")
+    return FlightPlanner(camera, side_overlap=85, forward_overlap=85)
+
+
+def test_float32_sweep_matches_float64():
+    planner = sequoia_planner()
+    heights = np.linspace(20,120,100001)
+    fp32 = planner.sweep(heights)
+    fp64 = planner.sweep(heights,dtype=np.float64)
+    for name in COLUMNS:
+        assert getattr(fp32,name).dtype == np.float32, name
+        np.testing.assert_allclose(getattr(fp32,name), getattr(fp64,name), rtol=1e-6, err_msg=name)
+
+
+def test_float32_sweep_is_written_with_shortest_repr(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    planner = sequoia_planner()
+    plans = planner.sweep([60,90])
+    planner.write_batch(plans)
+    planner.flush()
+    with open("sequoia_90.json") as f:
+        plan = json.load(f)[1]
+    for name in COLUMNS:
+        expected = np.asarray(getattr(plans,name)[1])
+        written = np.asarray(plan[name])
+        # exact in single precision and no longer than its float32 repr
+        np.testing.assert_array_equal(written.astype(np.float32), expected, err_msg=name)
+        assert [repr(v) for v in written.ravel().tolist()] == [str(v) for v in expected.ravel()], name
+
+
+def test_compute_batch_rejects_mismatched_out():
+    planner = sequoia_planner()
+    out = planner.compute_batch(np.linspace(20,120,5))
+    with pytest.raises(ValueError):
+        planner.compute_batch(np.linspace(20,120,4), out=out)
+    with pytest.raises(ValueError):
+        planner.compute_batch(np.linspace(20,120,5), out=out, dtype=np.float32)